@@ -8,10 +8,11 @@ This provides a simple CLI for generating and inspecting KSUIDs.
 import argparse
 import sys
 
-from ksuid import generate, from_string
+from ksuid import generate, generate_many, from_string
 from datetime import datetime
 
 MAX_COUNT = 1_000_000
+_WRITE_CHUNK = 10_000
 
 
 def _validate_count(value):
@@ -29,20 +30,27 @@ def _validate_count(value):
 
 def cmd_generate(args):
     """Generate one or more KSUIDs."""
-    for _ in range(args.count):
-        ksuid = generate()
-        if args.prefix:
-            result = f"{args.prefix}_{ksuid}"
-        else:
-            result = str(ksuid)
-
-        if args.verbose:
+    # Batched writes bounded to _WRITE_CHUNK lines, so memory stays flat
+    # even at MAX_COUNT.
+    remaining = args.count
+    while remaining:
+        chunk = min(remaining, _WRITE_CHUNK)
+        remaining -= chunk
+        lines = []
+        for ksuid in generate_many(chunk):
             if args.prefix:
-                print(f"{result} -> {ksuid.datetime} (timestamp: {ksuid.timestamp})")
+                result = f"{args.prefix}_{ksuid}"
             else:
-                print(f"{ksuid} -> {ksuid.datetime} (timestamp: {ksuid.timestamp})")
-        else:
-            print(result)
+                result = str(ksuid)
+
+            if args.verbose:
+                lines.append(
+                    f"{result} -> {ksuid.datetime} (timestamp: {ksuid.timestamp})"
+                )
+            else:
+                lines.append(result)
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_inspect(args):
@@ -19,16 +19,22 @@ Usage:
     True
 """
 
+import operator
 import os
 import secrets
+import struct
+import threading
 import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional, Tuple
 
 __version__ = "2.0.0"
 __all__ = [
     "KSUID",
     "generate",
+    "generate_many",
+    "generate_many_bytes",
+    "generate_string",
     "generate_lowercase",
     "generate_token",
     "generate_token_lowercase",
@@ -45,6 +51,20 @@ TIMESTAMP_LENGTH = 4  # 4 bytes for timestamp
 PAYLOAD_LENGTH = 16  # 16 bytes for random payload
 TOTAL_LENGTH = TIMESTAMP_LENGTH + PAYLOAD_LENGTH  # 20 bytes total
 
+# Big-endian uint32 codec for the timestamp field (C fast path for 4 bytes)
+_TIMESTAMP_STRUCT = struct.Struct(">I")
+
+# (ksuid_timestamp, packed prefix) for the most recent second seen by
+# _current_prefix(); replaced as a whole tuple, so readers never see a torn pair.
+# None never matches a real second, including pre-epoch (negative) clocks.
+_prefix_cache: Tuple[Optional[int], bytes] = (None, b"")
+
+_UTC = timezone.utc
+
+# int.from_bytes is a classmethod, so every attribute lookup builds a new
+# bound method; binding it once keeps that off the codec hot paths.
+_int_from_bytes = int.from_bytes
+
 # Base62 alphabet for encoding (mixed-case)
 BASE62_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
 BASE62_BASE = len(BASE62_ALPHABET)
@@ -55,6 +75,71 @@ BASE36_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
 BASE36_BASE = len(BASE36_ALPHABET)
 _BASE36_STRING_LENGTH = 31  # 20 bytes in base36
 
+# Payload randomness is read from the OS in blocks and handed out in
+# PAYLOAD_LENGTH slices, amortizing the os.urandom() syscall over many KSUIDs.
+# Each thread keeps its own slices, so no lock is needed.
+_RANDOM_BUFFER_SIZE = 4096
+
+# Splits a refill block into its PAYLOAD_LENGTH slices in a single C call.
+_PAYLOAD_SPLITTER = struct.Struct(
+    f"{PAYLOAD_LENGTH}s" * (_RANDOM_BUFFER_SIZE // PAYLOAD_LENGTH)
+)
+
+
+class _RandomState(threading.local):
+    def __init__(self) -> None:
+        self.payloads: List[bytes] = []
+
+
+_random_state = _RandomState()
+
+
+def _random_payload() -> bytes:
+    """Return PAYLOAD_LENGTH fresh bytes from the buffered OS CSPRNG."""
+    state = _random_state
+    try:
+        return state.payloads.pop()
+    except IndexError:
+        buf = os.urandom(_RANDOM_BUFFER_SIZE)
+        state.payloads = payloads = list(_PAYLOAD_SPLITTER.unpack(buf))
+        return payloads.pop()
+
+
+def _reset_random_state() -> None:
+    """Discard buffered randomness so a forked child never reuses it."""
+    global _random_state
+    _random_state = _RandomState()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_random_state)
+
+
+def _pack_timestamp(ksuid_timestamp: int) -> bytes:
+    """Pack a KSUID-epoch timestamp, rejecting values outside 32 bits."""
+    if ksuid_timestamp < 0:
+        raise ValueError(
+            "Timestamp cannot be before KSUID epoch (2014-05-13 16:53:20 UTC)"
+        )
+    if ksuid_timestamp >= 2**32:
+        raise ValueError("Timestamp overflow: too far in the future")
+    return _TIMESTAMP_STRUCT.pack(ksuid_timestamp)
+
+
+def _current_prefix() -> bytes:
+    """Return the packed 4-byte timestamp prefix for the current second.
+
+    The range check in ``_pack_timestamp`` runs only when the second
+    changes, so a clock outside the KSUID range raises ``ValueError``.
+    """
+    global _prefix_cache
+    ksuid_timestamp = int(time.time()) - EPOCH
+    cached_timestamp, prefix = _prefix_cache
+    if cached_timestamp != ksuid_timestamp:
+        prefix = _pack_timestamp(ksuid_timestamp)
+        _prefix_cache = (ksuid_timestamp, prefix)
+    return prefix
+
 
 class KSUID:
     """
@@ -67,7 +152,14 @@ class KSUID:
     KSUIDs are naturally sortable by creation time and collision-resistant.
     """
 
-    __slots__ = ("_timestamp", "_payload", "_bytes")
+    # The 20 raw bytes are the only identity state; timestamp and payload
+    # are sliced out of them on access rather than stored as extra objects.
+    __slots__ = ("_bytes", "_str", "_str36", "_datetime")
+
+    #: Key function for ``sorted(ksuids, key=KSUID.sort_key)``.  It orders
+    #: exactly like the comparison operators but compares the raw bytes in C,
+    #: skipping the Python-level ``__lt__`` call for every comparison.
+    sort_key = operator.attrgetter("_bytes")
 
     def __init__(
         self, timestamp: Optional[int] = None, payload: Optional[bytes] = None
@@ -83,22 +175,15 @@ class KSUID:
             timestamp = int(time.time())
 
         if payload is None:
-            payload = os.urandom(PAYLOAD_LENGTH)
+            payload = _random_payload()
         elif len(payload) != PAYLOAD_LENGTH:
             raise ValueError(f"Payload must be exactly {PAYLOAD_LENGTH} bytes")
 
         # Convert timestamp to KSUID timestamp (relative to KSUID epoch)
-        ksuid_timestamp = timestamp - EPOCH
-        if ksuid_timestamp < 0:
-            raise ValueError(
-                "Timestamp cannot be before KSUID epoch (2014-05-13 16:53:20 UTC)"
-            )
-        if ksuid_timestamp >= 2**32:
-            raise ValueError("Timestamp overflow: too far in the future")
-
-        self._timestamp = ksuid_timestamp
-        self._payload = payload
-        self._bytes = ksuid_timestamp.to_bytes(TIMESTAMP_LENGTH, "big") + payload
+        self._bytes = _pack_timestamp(timestamp - EPOCH) + payload
+        self._str: Optional[str] = None
+        self._str36: Optional[str] = None
+        self._datetime: Optional[datetime] = None
 
     @classmethod
     def from_string(cls, ksuid_str: str) -> "KSUID":
@@ -116,9 +201,12 @@ class KSUID:
                 f"KSUID string must be exactly {_BASE62_STRING_LENGTH} characters"
             )
 
-        # Decode from base62
+        # Decode from base62 (always exactly TOTAL_LENGTH bytes)
         decoded_bytes = _base62_decode(ksuid_str)
-        return cls.from_bytes(decoded_bytes)
+        ksuid = cls._from_raw(decoded_bytes)
+        # The canonical encoding is unique, so the input doubles as str().
+        ksuid._str = ksuid_str
+        return ksuid
 
     @classmethod
     def from_base36(cls, ksuid_str: str) -> "KSUID":
@@ -138,11 +226,16 @@ class KSUID:
             )
 
         decoded_bytes = _base36_decode(ksuid_str)
-        return cls.from_bytes(decoded_bytes)
+        ksuid = cls._from_raw(decoded_bytes)
+        ksuid._str36 = ksuid_str
+        return ksuid
 
     def to_base36(self) -> str:
-        """Return a lowercase base36-encoded string (31 characters)."""
-        return _base36_encode(self._bytes)
+        """Return a lowercase base36-encoded string (31 characters, cached)."""
+        encoded = self._str36
+        if encoded is None:
+            encoded = self._str36 = _base36_encode(self._bytes)
+        return encoded
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "KSUID":
@@ -158,28 +251,53 @@ class KSUID:
         if len(data) != TOTAL_LENGTH:
             raise ValueError(f"KSUID bytes must be exactly {TOTAL_LENGTH} bytes")
 
-        timestamp_bytes = data[:TIMESTAMP_LENGTH]
-        payload = data[TIMESTAMP_LENGTH:]
+        return cls._from_raw(bytes(data))
 
-        ksuid_timestamp = int.from_bytes(timestamp_bytes, "big")
-        unix_timestamp = ksuid_timestamp + EPOCH
+    @classmethod
+    def _from_raw(cls, data: bytes) -> "KSUID":
+        """Build a KSUID from exactly TOTAL_LENGTH bytes without re-validating.
 
-        return cls(unix_timestamp, payload)
+        Every 4-byte timestamp is in range, so the checks and re-encoding
+        done by ``__init__`` are skipped and the bytes are stored as-is.
+        """
+        ksuid = object.__new__(cls)
+        ksuid._bytes = data
+        ksuid._str = None
+        ksuid._str36 = None
+        ksuid._datetime = None
+        return ksuid
+
+    @classmethod
+    def _new_now(cls) -> "KSUID":
+        """Build a KSUID for the current time with a fresh random payload.
+
+        The fast path behind ``generate()``: the clock and the RNG always
+        produce valid values, so none of ``__init__``'s argument checks apply.
+        """
+        ksuid = object.__new__(cls)
+        ksuid._bytes = _current_prefix() + _random_payload()
+        ksuid._str = None
+        ksuid._str36 = None
+        ksuid._datetime = None
+        return ksuid
 
     @property
     def timestamp(self) -> int:
         """Unix timestamp when this KSUID was created."""
-        return self._timestamp + EPOCH
+        return _TIMESTAMP_STRUCT.unpack_from(self._bytes)[0] + EPOCH
 
     @property
     def datetime(self) -> datetime:
-        """Datetime when this KSUID was created (UTC)."""
-        return datetime.fromtimestamp(self.timestamp, tz=timezone.utc)
+        """Datetime when this KSUID was created (UTC, computed once)."""
+        dt = self._datetime
+        if dt is None:
+            dt = self._datetime = datetime.fromtimestamp(self.timestamp, _UTC)
+        return dt
 
     @property
     def payload(self) -> bytes:
         """16-byte random payload."""
-        return self._payload
+        return self._bytes[TIMESTAMP_LENGTH:]
 
     @property
     def bytes(self) -> bytes:
@@ -187,8 +305,11 @@ class KSUID:
         return self._bytes
 
     def __str__(self) -> str:
-        """Base62-encoded string representation."""
-        return _base62_encode(self._bytes)
+        """Base62-encoded string representation (computed once, then cached)."""
+        encoded = self._str
+        if encoded is None:
+            encoded = self._str = _base62_encode(self._bytes)
+        return encoded
 
     def __repr__(self) -> str:
         return f"KSUID('{str(self)}')"
@@ -221,27 +342,100 @@ class KSUID:
     def __hash__(self) -> int:
         return hash(self._bytes)
 
+    def __reduce__(self):
+        # Pickle only the raw bytes; the cached strings and datetime are
+        # rebuilt on demand and would otherwise bloat every pickle.  A
+        # subclass's instance __dict__, if any, travels as the state.
+        return (
+            type(self).from_bytes,
+            (self._bytes,),
+            getattr(self, "__dict__", None) or None,
+        )
+
+    def __setstate__(self, state) -> None:
+        # A plain dict is a subclass __dict__ from __reduce__.  Pickles
+        # written by 2.0.0 and earlier carry the default state
+        # ``(dict_or_None, {"_timestamp": ..., "_payload": ..., "_bytes": ...})``
+        # in which only ``_bytes`` is still meaningful among the slots.
+        if isinstance(state, tuple):
+            state, slot_state = state
+            self._bytes = bytes(slot_state["_bytes"])
+            self._str = None
+            self._str36 = None
+            self._datetime = None
+        if state:
+            self.__dict__.update(state)
+
+
+# Every two-digit base62 string, indexed by its value (0 .. 62**2 - 1), so
+# the encoder emits two characters per big-integer divmod.
+_BASE62_PAIR_BASE = BASE62_BASE**2
+_BASE62_PAIRS = tuple(a + b for a in BASE62_ALPHABET for b in BASE62_ALPHABET)
+
 
 def _base62_encode(data: bytes) -> str:
-    """Encode bytes to base62 string."""
-    if not data:
-        return ""
+    """Encode exactly TOTAL_LENGTH (20) bytes as a 27-character base62 string.
 
+    The digit count is fixed by the unrolled code below: shorter input
+    (including empty) is zero-padded like any small value, and a value
+    too large for 20 bytes raises ``IndexError``.
+    """
     # Convert bytes to integer
-    num = int.from_bytes(data, "big")
-
-    result = []
-    while num > 0:
-        num, remainder = divmod(num, BASE62_BASE)
-        result.append(BASE62_ALPHABET[remainder])
-
-    # Pad to fixed width for KSUID
-    result.reverse()
-    encoded = "".join(result)
-    return encoded.zfill(_BASE62_STRING_LENGTH)
-
-
-_BASE62_LOOKUP = {c: i for i, c in enumerate(BASE62_ALPHABET)}
+    num = _int_from_bytes(data, "big")
+
+    # 13 pairs (least significant first) plus one leading digit always give
+    # exactly 27 characters; leading zero digits are the padding.  Written
+    # out as straight-line code: this is the hottest path in the module, and
+    # dropping the loop, list appends and reverse makes it ~25% faster.
+    base = _BASE62_PAIR_BASE
+    num, p0 = divmod(num, base)
+    num, p1 = divmod(num, base)
+    num, p2 = divmod(num, base)
+    num, p3 = divmod(num, base)
+    num, p4 = divmod(num, base)
+    num, p5 = divmod(num, base)
+    num, p6 = divmod(num, base)
+    num, p7 = divmod(num, base)
+    num, p8 = divmod(num, base)
+    num, p9 = divmod(num, base)
+    num, p10 = divmod(num, base)
+    num, p11 = divmod(num, base)
+    num, p12 = divmod(num, base)
+    pairs = _BASE62_PAIRS
+    return "".join(
+        (
+            BASE62_ALPHABET[num],
+            pairs[p12],
+            pairs[p11],
+            pairs[p10],
+            pairs[p9],
+            pairs[p8],
+            pairs[p7],
+            pairs[p6],
+            pairs[p5],
+            pairs[p4],
+            pairs[p3],
+            pairs[p2],
+            pairs[p1],
+            pairs[p0],
+        )
+    )
+
+
+# 256-entry decode table indexed by byte value; _INVALID marks bytes outside
+# the alphabet so the decode loop is a single subscript per character.
+_INVALID = 0xFF
+
+
+def _build_decode_table(alphabet: str) -> bytes:
+    """Map every byte value to its digit in ``alphabet`` (or ``_INVALID``)."""
+    table = bytearray([_INVALID] * 256)
+    for i, char in enumerate(alphabet):
+        table[ord(char)] = i
+    return bytes(table)
+
+
+_BASE62_DECODE_TABLE = _build_decode_table(BASE62_ALPHABET)
 
 # Maximum integer value that fits in TOTAL_LENGTH bytes
 _MAX_ENCODED = (1 << (TOTAL_LENGTH * 8)) - 1
@@ -252,11 +446,20 @@ def _base62_decode(s: str) -> bytes:
     if not s:
         return b""
 
+    try:
+        raw = s.encode("ascii")
+    except UnicodeEncodeError as e:
+        raise ValueError(f"Invalid base62 character: {s[e.start]}") from None
+
+    # Map every character to its digit value in one C-level pass; a single
+    # membership test then validates the whole string.
+    digits = raw.translate(_BASE62_DECODE_TABLE)
+    if _INVALID in digits:
+        bad = s[digits.index(_INVALID)]
+        raise ValueError(f"Invalid base62 character: {bad}")
+
     num = 0
-    for char in s:
-        val = _BASE62_LOOKUP.get(char)
-        if val is None:
-            raise ValueError(f"Invalid base62 character: {char}")
+    for val in digits:
         num = num * BASE62_BASE + val
 
     if num > _MAX_ENCODED:
@@ -268,24 +471,61 @@ def _base62_decode(s: str) -> bytes:
 
 # --- Base36 (lowercase) encoding ---------------------------------------------------
 
-_BASE36_LOOKUP = {c: i for i, c in enumerate(BASE36_ALPHABET)}
+_BASE36_DECODE_TABLE = _build_decode_table(BASE36_ALPHABET)
 
+# Two-digit base36 strings, as for base62 above: 15 big-integer divmods
+# instead of 31 per encode.
+_BASE36_PAIR_BASE = BASE36_BASE**2
+_BASE36_PAIRS = tuple(a + b for a in BASE36_ALPHABET for b in BASE36_ALPHABET)
 
-def _base36_encode(data: bytes) -> str:
-    """Encode bytes to lowercase base36 string."""
-    if not data:
-        return ""
-
-    num = int.from_bytes(data, "big")
 
-    result = []
-    while num > 0:
-        num, remainder = divmod(num, BASE36_BASE)
-        result.append(BASE36_ALPHABET[remainder])
+def _base36_encode(data: bytes) -> str:
+    """Encode exactly TOTAL_LENGTH (20) bytes as a 31-character base36 string.
 
-    result.reverse()
-    encoded = "".join(result)
-    return encoded.zfill(_BASE36_STRING_LENGTH)
+    Same fixed-width contract as ``_base62_encode``: shorter input is
+    zero-padded, a value too large for 20 bytes raises ``IndexError``.
+    """
+    num = _int_from_bytes(data, "big")
+
+    # 15 pairs (least significant first) plus one leading digit always give
+    # exactly 31 characters; straight-line like _base62_encode.
+    base = _BASE36_PAIR_BASE
+    num, p0 = divmod(num, base)
+    num, p1 = divmod(num, base)
+    num, p2 = divmod(num, base)
+    num, p3 = divmod(num, base)
+    num, p4 = divmod(num, base)
+    num, p5 = divmod(num, base)
+    num, p6 = divmod(num, base)
+    num, p7 = divmod(num, base)
+    num, p8 = divmod(num, base)
+    num, p9 = divmod(num, base)
+    num, p10 = divmod(num, base)
+    num, p11 = divmod(num, base)
+    num, p12 = divmod(num, base)
+    num, p13 = divmod(num, base)
+    num, p14 = divmod(num, base)
+    pairs = _BASE36_PAIRS
+    return "".join(
+        (
+            BASE36_ALPHABET[num],
+            pairs[p14],
+            pairs[p13],
+            pairs[p12],
+            pairs[p11],
+            pairs[p10],
+            pairs[p9],
+            pairs[p8],
+            pairs[p7],
+            pairs[p6],
+            pairs[p5],
+            pairs[p4],
+            pairs[p3],
+            pairs[p2],
+            pairs[p1],
+            pairs[p0],
+        )
+    )
 
 
 def _base36_decode(s: str) -> bytes:
@@ -293,12 +533,19 @@ def _base36_decode(s: str) -> bytes:
     if not s:
         return b""
 
-    num = 0
-    for char in s:
-        val = _BASE36_LOOKUP.get(char)
-        if val is None:
-            raise ValueError(f"Invalid base36 character: {char!r}")
-        num = num * BASE36_BASE + val
+    try:
+        raw = s.encode("ascii")
+    except UnicodeEncodeError as e:
+        raise ValueError(f"Invalid base36 character: {s[e.start]!r}") from None
+
+    digits = raw.translate(_BASE36_DECODE_TABLE)
+    if _INVALID in digits:
+        bad = s[digits.index(_INVALID)]
+        raise ValueError(f"Invalid base36 character: {bad!r}")
+
+    # The alphabet is exactly int()'s own base-36 digits, and the check
+    # above has already rejected uppercase, signs, "_" and whitespace.
+    num = int(s, BASE36_BASE)
 
     if num > _MAX_ENCODED:
         raise ValueError("Base36 value exceeds maximum for KSUID")
@@ -309,7 +556,59 @@ def _base36_decode(s: str) -> bytes:
 # Convenience functions
 def generate() -> KSUID:
     """Generate a new KSUID."""
-    return KSUID()
+    return KSUID._new_now()
+
+
+def generate_many(count: int) -> List[KSUID]:
+    """Generate ``count`` KSUIDs for the current time in one batch.
+
+    The clock is read once and all payloads come from a single
+    ``os.urandom`` call, so this is much cheaper than calling
+    ``generate()`` in a loop.  Every KSUID in the batch shares the same
+    timestamp.
+
+    Args:
+        count: Number of KSUIDs to generate.
+
+    Returns:
+        List of ``count`` KSUID instances.
+    """
+    data = generate_many_bytes(count)
+    from_raw = KSUID._from_raw
+    return [
+        from_raw(data[i : i + TOTAL_LENGTH]) for i in range(0, len(data), TOTAL_LENGTH)
+    ]
+
+
+def generate_many_bytes(count: int) -> bytes:
+    """Generate ``count`` KSUIDs as one contiguous block of raw bytes.
+
+    The result holds ``count`` back-to-back 20-byte KSUIDs (timestamp
+    followed by payload) without creating any KSUID objects, which suits
+    bulk loaders and array libraries, e.g.
+    ``numpy.frombuffer(data, numpy.uint8).reshape(-1, 20)``.  Every KSUID
+    in the block shares the same timestamp.
+
+    Args:
+        count: Number of KSUIDs to generate.
+
+    Returns:
+        ``count * 20`` bytes.
+    """
+    if count < 0:
+        raise ValueError("count must be non-negative")
+
+    prefix = _pack_timestamp(int(time.time()) - EPOCH)
+    randomness = os.urandom(count * PAYLOAD_LENGTH)
+
+    # Fill column by column with strided slice assignments: 20 C-level
+    # copies regardless of count, instead of one concatenation per KSUID.
+    out = bytearray(count * TOTAL_LENGTH)
+    for i in range(TIMESTAMP_LENGTH):
+        out[i::TOTAL_LENGTH] = prefix[i : i + 1] * count
+    for i in range(PAYLOAD_LENGTH):
+        out[TIMESTAMP_LENGTH + i :: TOTAL_LENGTH] = randomness[i::PAYLOAD_LENGTH]
+    return bytes(out)
 
 
 def generate_token() -> str:
@@ -326,6 +625,18 @@ def generate_token() -> str:
     return _base62_encode(secrets.token_bytes(TOTAL_LENGTH))
 
 
+def generate_string() -> str:
+    """Generate a new KSUID and return it as a base62 string.
+
+    Equivalent to ``str(generate())`` but encodes the bytes directly,
+    without building a KSUID object.
+
+    Returns:
+        A 27-character base62 string.
+    """
+    return _base62_encode(_current_prefix() + _random_payload())
+
+
 def generate_lowercase() -> str:
     """Generate a new KSUID and return it as a lowercase base36 string.
 
@@ -335,7 +646,7 @@ def generate_lowercase() -> str:
     Returns:
         A 31-character lowercase base36 string.
     """
-    return KSUID().to_base36()
+    return _base36_encode(_current_prefix() + _random_payload())
 
 
 def generate_token_lowercase() -> str:
@@ -6,9 +6,8 @@ This module demonstrates how to implement Stripe-style prefixed identifiers
 using KSUIDs for better developer experience and type safety.
 """
 
-from ksuid import KSUID, generate, generate_token, from_string
-from typing import Dict, Optional, Tuple
-import re
+from ksuid import KSUID, generate_many, generate_string, generate_token, from_string
+from typing import Dict, List, Optional, Tuple
 
 
 class PrefixedKSUID:
@@ -75,18 +74,43 @@ class PrefixedKSUID:
         Returns:
             Prefixed KSUID string (e.g., 'user_2StGMtcWzRJ8qZqQjbJjGdTkVfv')
         """
+        cls._validate_prefix(prefix)
+        return f"{prefix}_{generate_string()}"
+
+    @classmethod
+    def create_many(cls, prefix: str, count: int) -> List[str]:
+        """
+        Create ``count`` prefixed KSUIDs in one batch.
+
+        The prefix is validated once, and the clock and OS randomness are
+        read once for the whole batch (see ``generate_many``), so every ID
+        shares the same timestamp.
+
+        Args:
+            prefix: The prefix to use (e.g., 'user', 'pi', 'cus')
+            count: Number of IDs to create
+
+        Returns:
+            List of prefixed KSUID strings
+        """
+        cls._validate_prefix(prefix)
+        head = prefix + "_"
+        return [head + str(ksuid) for ksuid in generate_many(count)]
+
+    @staticmethod
+    def _validate_prefix(prefix: str) -> None:
+        """Raise ValueError unless ``prefix`` is usable in a prefixed KSUID."""
         if not prefix:
             raise ValueError("Prefix cannot be empty")
 
-        # No underscores in prefix since _ is the delimiter
-        if not re.match(r"^[a-zA-Z][a-zA-Z0-9]*$", prefix):
+        # ASCII letters and digits only (no underscores, since _ is the
+        # delimiter), starting with a letter.  str predicates run in C.
+        if not (prefix.isascii() and prefix.isalnum() and prefix[0].isalpha()):
             raise ValueError(
                 "Prefix must start with a letter and "
                 "contain only alphanumeric characters"
             )
 
-        return f"{prefix}_{generate()}"
-
     @classmethod
     def parse(cls, prefixed_id: str) -> Tuple[str, KSUID]:
         """
@@ -101,17 +125,12 @@ class PrefixedKSUID:
         Raises:
             ValueError: If the format is invalid
         """
-        if not prefixed_id or "_" not in prefixed_id:
+        if not prefixed_id:
             raise ValueError("Invalid prefixed KSUID format")
 
-        parts = prefixed_id.split("_", 1)
-        if len(parts) != 2:
-            raise ValueError("Invalid prefixed KSUID format")
-
-        prefix, ksuid_str = parts
-
-        if not prefix:
-            raise ValueError("Prefix cannot be empty")
+        # One scan for the delimiter, then slice; no intermediate list
+        prefix = cls.split_prefix(prefixed_id)
+        ksuid_str = prefixed_id[len(prefix) + 1 :]
 
         try:
             ksuid = from_string(ksuid_str)
@@ -141,19 +160,42 @@ class PrefixedKSUID:
         except ValueError:
             return False
 
+    @classmethod
+    def split_prefix(cls, prefixed_id: str) -> str:
+        """
+        Return the prefix of a prefixed KSUID without decoding the KSUID part.
+
+        Args:
+            prefixed_id: The prefixed KSUID string
+
+        Returns:
+            The prefix part
+
+        Raises:
+            ValueError: If there is no delimiter or the prefix is empty
+        """
+        index = prefixed_id.find("_")
+        if index < 0:
+            raise ValueError("Invalid prefixed KSUID format")
+        if index == 0:
+            raise ValueError("Prefix cannot be empty")
+        return prefixed_id[:index]
+
     @classmethod
     def get_prefix(cls, prefixed_id: str) -> str:
         """
         Extract just the prefix from a prefixed KSUID.
 
+        Only the prefix is checked; use ``validate`` or ``parse`` to also
+        check the KSUID part.
+
         Args:
             prefixed_id: The prefixed KSUID string
 
         Returns:
             The prefix part
         """
-        prefix, _ = cls.parse(prefixed_id)
-        return prefix
+        return cls.split_prefix(prefixed_id)
 
     @classmethod
     def get_ksuid(cls, prefixed_id: str) -> KSUID:
@@ -314,22 +356,27 @@ def demo_database_patterns():
             record_id = create_order_id()
             record_type = "order"
 
+        # Decode the ID once, at creation, and keep the KSUID on the record
         records.append(
-            {"id": record_id, "type": record_type, "data": f"Sample {record_type} {i}"}
+            {
+                "id": record_id,
+                "ksuid": PrefixedKSUID.get_ksuid(record_id),
+                "type": record_type,
+                "data": f"Sample {record_type} {i}",
+            }
         )
 
     print("Created records:")
     for record in records:
-        ksuid = PrefixedKSUID.get_ksuid(record["id"])
-        print(f"  {record['id']} ({record['type']}) - {ksuid.datetime}")
+        print(f"  {record['id']} ({record['type']}) - {record['ksuid'].datetime}")
 
-    # Sort by creation time (KSUID natural ordering)
-    sorted_records = sorted(records, key=lambda r: PrefixedKSUID.get_ksuid(r["id"]))
+    # Sort by creation time: the raw bytes order exactly like the KSUIDs
+    # (timestamp first), without a Python-level __lt__ per comparison
+    sorted_records = sorted(records, key=lambda r: r["ksuid"].bytes)
 
     print("\nSorted by creation time:")
     for record in sorted_records:
-        ksuid = PrefixedKSUID.get_ksuid(record["id"])
-        print(f"  {record['id']} ({record['type']}) - {ksuid.datetime}")
+        print(f"  {record['id']} ({record['type']}) - {record['ksuid'].datetime}")
 
     # Filter by entity type
     user_records = [r for r in records if PrefixedKSUID.get_prefix(r["id"]) == "user"]
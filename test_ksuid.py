@@ -2,6 +2,9 @@
 Test suite for KSUID library.
 """
 
+import copy
+import os
+import pickle
 import time
 
 import pytest
@@ -9,6 +12,9 @@ from datetime import datetime, timezone
 from ksuid import (
     KSUID,
     generate,
+    generate_many,
+    generate_many_bytes,
+    generate_string,
     generate_lowercase,
     generate_token,
     generate_token_lowercase,
@@ -18,6 +24,52 @@ from ksuid import (
     EPOCH,
     _BASE36_STRING_LENGTH,
 )
+from prefixed_examples import PrefixedKSUID
+
+# Spelled out independently of ksuid's own alphabets
+_VALID_BASE62 = frozenset(
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+)
+_VALID_BASE36 = frozenset("0123456789abcdefghijklmnopqrstuvwxyz")
+
+# 2021-01-01 00:00:00 UTC, as a Unix timestamp and as the expected datetime
+_TS_2021 = 1609459200
+_EXPECTED_2021_UTC = datetime(2021, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+_PAYLOAD_ZERO = b"\x00" * 16
+_PAYLOAD_ONE = b"\x01" * 16
+_PAYLOAD_TWO = b"\x02" * 16
+
+
+@pytest.fixture(scope="module")
+def sample_ksuid():
+    """One KSUID shared by the round-trip tests (KSUIDs are immutable)."""
+    return KSUID()
+
+
+@pytest.fixture(scope="module")
+def sample_ksuids():
+    """32 varied KSUIDs, including the boundary timestamps and payloads."""
+    return [
+        KSUID(timestamp=EPOCH, payload=_PAYLOAD_ZERO),
+        KSUID(timestamp=EPOCH + 2**32 - 1, payload=b"\xff" * 16),
+        KSUID(timestamp=_TS_2021, payload=bytes(range(16))),
+    ] + [KSUID() for _ in range(29)]
+
+
+@pytest.fixture(scope="module")
+def canonical_ksuids():
+    """Three KSUIDs at _TS_2021 with payloads _PAYLOAD_ZERO/_ONE/_TWO."""
+    return tuple(
+        KSUID(timestamp=_TS_2021, payload=payload)
+        for payload in (_PAYLOAD_ZERO, _PAYLOAD_ONE, _PAYLOAD_TWO)
+    )
+
+
+@pytest.fixture(scope="module")
+def sortable_triple():
+    """KSUIDs one second apart from _TS_2021, all with _PAYLOAD_ZERO."""
+    return [KSUID(timestamp=_TS_2021 + i, payload=_PAYLOAD_ZERO) for i in range(3)]
 
 
 class TestKSUID:
@@ -42,14 +94,12 @@ class TestKSUID:
 
     def test_ksuid_with_custom_timestamp(self):
         """Test KSUID creation with custom timestamp."""
-        custom_timestamp = 1609459200  # 2021-01-01 00:00:00 UTC
-        ksuid = KSUID(timestamp=custom_timestamp)
+        ksuid = KSUID(timestamp=_TS_2021)
 
-        assert ksuid.timestamp == custom_timestamp
+        assert ksuid.timestamp == _TS_2021
 
         # Check datetime conversion
-        expected_dt = datetime.fromtimestamp(custom_timestamp, tz=timezone.utc)
-        assert ksuid.datetime == expected_dt
+        assert ksuid.datetime == _EXPECTED_2021_UTC
 
     def test_ksuid_with_custom_payload(self):
         """Test KSUID creation with custom payload."""
@@ -76,9 +126,9 @@ class TestKSUID:
         with pytest.raises(ValueError, match="Timestamp overflow"):
             KSUID(timestamp=EPOCH + 2**32)
 
-    def test_from_string(self):
+    def test_from_string(self, sample_ksuid):
         """Test creating KSUID from string representation."""
-        ksuid1 = KSUID()
+        ksuid1 = sample_ksuid
         ksuid_str = str(ksuid1)
         ksuid2 = KSUID.from_string(ksuid_str)
 
@@ -103,14 +153,22 @@ class TestKSUID:
         with pytest.raises(ValueError, match="Invalid base62 character"):
             KSUID.from_string("!" * 27)  # Invalid character
 
+    def test_from_string_non_ascii_characters(self):
+        """Test that non-ASCII characters raise ValueError, not UnicodeError."""
+        with pytest.raises(ValueError, match="Invalid base62 character: é"):
+            KSUID.from_string("é" * 27)
+
+        with pytest.raises(ValueError, match="Invalid base62 character"):
+            KSUID.from_string("\xff" * 27)
+
     def test_from_string_overflow(self):
         """Test that a base62 string exceeding 20-byte max raises ValueError."""
         with pytest.raises(ValueError, match="Base62 value exceeds maximum"):
             KSUID.from_string("z" * 27)  # Exceeds 2^160 - 1
 
-    def test_from_bytes(self):
+    def test_from_bytes(self, sample_ksuid):
         """Test creating KSUID from bytes."""
-        ksuid1 = KSUID()
+        ksuid1 = sample_ksuid
         ksuid_bytes = ksuid1.bytes
         ksuid2 = KSUID.from_bytes(ksuid_bytes)
 
@@ -118,6 +176,17 @@ class TestKSUID:
         assert ksuid1.timestamp == ksuid2.timestamp
         assert ksuid1.payload == ksuid2.payload
 
+    def test_from_bytes_copies_mutable_input(self):
+        """Test that a bytearray source cannot mutate the KSUID afterwards."""
+        data = bytearray(KSUID(timestamp=_TS_2021, payload=_PAYLOAD_ONE).bytes)
+        ksuid = KSUID.from_bytes(data)
+        data[-1] = 0
+
+        assert type(ksuid.bytes) is bytes
+        assert type(ksuid.payload) is bytes
+        assert ksuid.payload == _PAYLOAD_ONE
+        assert ksuid.timestamp == _TS_2021
+
     def test_from_bytes_invalid_length(self):
         """Test that invalid bytes length raises error."""
         with pytest.raises(ValueError, match="KSUID bytes must be exactly 20 bytes"):
@@ -126,12 +195,10 @@ class TestKSUID:
         with pytest.raises(ValueError, match="KSUID bytes must be exactly 20 bytes"):
             KSUID.from_bytes(b"\x01" * 25)  # Too long
 
-    def test_sortability(self):
+    def test_sortability(self, sortable_triple):
         """Test that KSUIDs are sortable by creation time."""
-        # Create KSUIDs with different timestamps
-        ksuid1 = KSUID(timestamp=1609459200)  # 2021-01-01
-        ksuid2 = KSUID(timestamp=1609459201)  # 2021-01-01 + 1 second
-        ksuid3 = KSUID(timestamp=1609459202)  # 2021-01-01 + 2 seconds
+        # 2021-01-01, then +1 and +2 seconds, identical payloads
+        ksuid1, ksuid2, ksuid3 = sortable_triple
 
         # Test all comparison operators
         assert ksuid1 < ksuid2 < ksuid3
@@ -144,19 +211,23 @@ class TestKSUID:
         sorted_ksuids = sorted(ksuids)
         assert sorted_ksuids == [ksuid1, ksuid2, ksuid3]
 
-    def test_equality(self):
+    def test_sort_key_matches_natural_order(self):
+        """Test that KSUID.sort_key sorts exactly like the comparison operators."""
+        ksuids = [generate() for _ in range(50)]
+        ksuids += [KSUID(timestamp=_TS_2021 + i % 3) for i in range(50)]
+
+        assert sorted(ksuids, key=KSUID.sort_key) == sorted(ksuids)
+
+    def test_equality(self, canonical_ksuids):
         """Test KSUID equality."""
-        # Same timestamp and payload should be equal
-        timestamp = 1609459200
-        payload = b"\x01" * 16
-        ksuid1 = KSUID(timestamp=timestamp, payload=payload)
-        ksuid2 = KSUID(timestamp=timestamp, payload=payload)
+        # Same timestamp and payload should be equal (a separate instance)
+        _, ksuid1, ksuid3 = canonical_ksuids
+        ksuid2 = KSUID(timestamp=_TS_2021, payload=_PAYLOAD_ONE)
 
         assert ksuid1 == ksuid2
         assert hash(ksuid1) == hash(ksuid2)
 
         # Different payload should not be equal
-        ksuid3 = KSUID(timestamp=timestamp, payload=b"\x02" * 16)
         assert ksuid1 != ksuid3
 
     def test_equality_with_non_ksuid(self):
@@ -178,27 +249,58 @@ class TestKSUID:
         assert ksuid_str in repr(ksuid)
         assert "KSUID" in repr(ksuid)
 
-    def test_round_trip_conversion(self):
-        """Test that string/bytes conversions are reversible."""
-        ksuid1 = KSUID()
+    def test_fields_derive_from_raw_bytes(self):
+        """Test that timestamp and payload are read back from the raw bytes."""
+        payload = bytes(range(16))
+        ksuid = KSUID(timestamp=_TS_2021, payload=payload)
+        assert ksuid.bytes == (_TS_2021 - EPOCH).to_bytes(4, "big") + payload
+        assert ksuid.timestamp == _TS_2021
+        assert ksuid.payload == payload
+        assert not hasattr(ksuid, "__dict__")
 
-        # String round trip
-        ksuid_str = str(ksuid1)
-        ksuid2 = KSUID.from_string(ksuid_str)
-        assert ksuid1 == ksuid2
+    def test_string_is_cached(self):
+        """Test that the base62 string is encoded once and then reused."""
+        ksuid = KSUID()
+        assert str(ksuid) is str(ksuid)
 
-        # Bytes round trip
-        ksuid_bytes = ksuid1.bytes
-        ksuid3 = KSUID.from_bytes(ksuid_bytes)
-        assert ksuid1 == ksuid3
+        ksuid_str = str(ksuid)
+        parsed = KSUID.from_string(ksuid_str)
+        assert str(parsed) is ksuid_str
+        assert str(KSUID.from_bytes(ksuid.bytes)) == ksuid_str
+
+    def test_base36_string_is_cached(self):
+        """Test that the base36 string is encoded once and then reused."""
+        ksuid = KSUID()
+        assert ksuid.to_base36() is ksuid.to_base36()
+
+        b36 = ksuid.to_base36()
+        assert KSUID.from_base36(b36).to_base36() is b36
+        assert KSUID.from_bytes(ksuid.bytes).to_base36() == b36
+
+    def test_round_trip_conversion(self, sample_ksuids):
+        """Test that string/bytes conversions are reversible."""
+        for ksuid1 in sample_ksuids:
+            # String round trip
+            ksuid_str = str(ksuid1)
+            ksuid2 = KSUID.from_string(ksuid_str)
+            assert ksuid1 == ksuid2
+
+            # Bytes round trip
+            ksuid_bytes = ksuid1.bytes
+            ksuid3 = KSUID.from_bytes(ksuid_bytes)
+            assert ksuid1 == ksuid3
 
     def test_datetime_property(self):
         """Test datetime property conversion."""
-        timestamp = 1609459200  # 2021-01-01 00:00:00 UTC
-        ksuid = KSUID(timestamp=timestamp)
+        ksuid = KSUID(timestamp=_TS_2021)
+
+        assert ksuid.datetime == _EXPECTED_2021_UTC
 
-        expected_dt = datetime(2021, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-        assert ksuid.datetime == expected_dt
+    def test_datetime_is_cached(self):
+        """Test that the datetime is built once and reused."""
+        ksuid = KSUID(timestamp=_TS_2021)
+        assert ksuid.datetime is ksuid.datetime
+        assert KSUID.from_bytes(ksuid.bytes).datetime == ksuid.datetime
 
 
 class TestConvenienceFunctions:
@@ -210,17 +312,87 @@ class TestConvenienceFunctions:
         assert isinstance(ksuid, KSUID)
         assert len(str(ksuid)) == 27
 
-    def test_from_string_function(self):
+    def test_generate_matches_constructor(self):
+        """Test that generate()'s fast path builds the same state as __init__."""
+        before = int(time.time())
+        ksuid = generate()
+        after = int(time.time())
+        assert before <= ksuid.timestamp <= after
+        assert ksuid == KSUID(timestamp=ksuid.timestamp, payload=ksuid.payload)
+        assert KSUID.from_string(str(ksuid)).bytes == ksuid.bytes
+
+    def test_generate_string(self):
+        """Test generate_string() returns a current base62 KSUID string."""
+        before = int(time.time())
+        s = generate_string()
+        assert len(s) == 27
+        assert before <= from_string(s).timestamp <= int(time.time())
+        assert generate_string() != s
+
+    def test_generate_refreshes_stale_prefix(self, monkeypatch):
+        """Test that a cached timestamp prefix from another second is replaced."""
+        monkeypatch.setattr("ksuid._prefix_cache", (0, b"\x00\x00\x00\x00"))
+        ksuid = generate()
+        assert ksuid.timestamp >= int(time.time()) - 1
+        assert ksuid.bytes[:4] == (ksuid.timestamp - EPOCH).to_bytes(4, "big")
+
+    @pytest.mark.parametrize("clock", [0.0, EPOCH - 1.0, EPOCH + 2.0**32])
+    def test_generate_with_clock_out_of_range(self, monkeypatch, clock):
+        """Test that a clock outside the KSUID range raises ValueError."""
+        monkeypatch.setattr("ksuid._prefix_cache", (None, b""))
+        monkeypatch.setattr(time, "time", lambda: clock)
+        for func in (
+            generate,
+            generate_string,
+            generate_lowercase,
+            lambda: generate_many(3),
+            lambda: generate_many_bytes(3),
+        ):
+            with pytest.raises(ValueError, match="KSUID epoch|overflow"):
+                func()
+
+    def test_generate_many(self):
+        """Test generate_many() batch generation."""
+        ksuids = generate_many(100)
+        assert len(ksuids) == 100
+        assert all(isinstance(k, KSUID) for k in ksuids)
+        assert len(set(ksuids)) == 100
+        assert len({k.timestamp for k in ksuids}) == 1
+        assert abs(ksuids[0].timestamp - int(time.time())) < 60
+        assert KSUID.from_string(str(ksuids[0])) == ksuids[0]
+
+    def test_generate_many_edge_counts(self):
+        """Test generate_many() with zero and negative counts."""
+        assert generate_many(0) == []
+        with pytest.raises(ValueError, match="non-negative"):
+            generate_many(-1)
+
+    def test_generate_many_bytes(self):
+        """Test generate_many_bytes() returns back-to-back 20-byte KSUIDs."""
+        data = generate_many_bytes(50)
+        assert isinstance(data, bytes)
+        assert len(data) == 50 * 20
+
+        ksuids = [from_bytes(data[i : i + 20]) for i in range(0, len(data), 20)]
+        assert len(set(ksuids)) == 50
+        assert len({k.timestamp for k in ksuids}) == 1
+        assert abs(ksuids[0].timestamp - int(time.time())) < 60
+
+        assert generate_many_bytes(0) == b""
+        with pytest.raises(ValueError, match="non-negative"):
+            generate_many_bytes(-1)
+
+    def test_from_string_function(self, sample_ksuid):
         """Test from_string() function."""
-        ksuid1 = generate()
+        ksuid1 = sample_ksuid
         ksuid_str = str(ksuid1)
         ksuid2 = from_string(ksuid_str)
 
         assert ksuid1 == ksuid2
 
-    def test_from_bytes_function(self):
+    def test_from_bytes_function(self, sample_ksuid):
         """Test from_bytes() function."""
-        ksuid1 = generate()
+        ksuid1 = sample_ksuid
         ksuid_bytes = ksuid1.bytes
         ksuid2 = from_bytes(ksuid_bytes)
 
@@ -241,16 +413,13 @@ class TestKSUIDProperties:
         sorted_ksuids = sorted(ksuids)
         assert len(sorted_ksuids) == 100
 
-    def test_ksuid_ordering_with_same_timestamp(self):
+    def test_ksuid_ordering_with_same_timestamp(self, canonical_ksuids):
         """Test KSUID ordering when timestamps are the same."""
-        timestamp = 1609459200
-
-        # Create KSUIDs with same timestamp but different payloads
-        ksuid1 = KSUID(timestamp=timestamp, payload=b"\x00" * 16)
-        ksuid2 = KSUID(timestamp=timestamp, payload=b"\x01" * 16)
+        # Same timestamp, payloads of all 0x00 / 0x01 / 0x02 bytes
+        ksuid1, ksuid2, ksuid3 = canonical_ksuids
 
         # They should still be comparable (by payload)
-        assert ksuid1 < ksuid2
+        assert ksuid1 < ksuid2 < ksuid3
 
     def test_base62_encoding_properties(self):
         """Test properties of base62 encoding."""
@@ -258,10 +427,7 @@ class TestKSUIDProperties:
         ksuid_str = str(ksuid)
 
         # Should only contain base62 characters
-        valid_chars = set(
-            "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
-        )
-        assert all(c in valid_chars for c in ksuid_str)
+        assert set(ksuid_str) <= _VALID_BASE62
 
         # Should be exactly 27 characters
         assert len(ksuid_str) == 27
@@ -277,9 +443,8 @@ class TestGenerateToken:
 
     def test_token_is_base62(self):
         """Token contains only valid base62 characters."""
-        valid = set("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
         token = generate_token()
-        assert all(c in valid for c in token)
+        assert set(token) <= _VALID_BASE62
 
     def test_tokens_are_unique(self):
         """Multiple tokens must all be distinct."""
@@ -323,6 +488,79 @@ class TestSlots:
             ksuid.foo = "bar"
 
 
+class _KSUIDSubclass(KSUID):
+    """Subclass with an instance __dict__, for the pickling tests."""
+
+
+class TestPickle:
+    """Verify KSUIDs survive pickling, including pickles from 2.0.0."""
+
+    # KSUID(_TS_2021, _PAYLOAD_ONE) pickled (protocol 2) by ksuid 2.0.0,
+    # whose default slot state also held ``_timestamp`` and ``_payload``.
+    _LEGACY_PICKLE = (
+        b"\x80\x02cksuid\nKSUID\nq\x00)\x81q\x01N}q\x02(X\n\x00\x00\x00_timestamp"
+        b"q\x03J\x00\x18|\x0cX\x08\x00\x00\x00_payloadq\x04c_codecs\nencode\nq\x05"
+        b"X\x10\x00\x00\x00" + _PAYLOAD_ONE + b"q\x06X\x06\x00\x00\x00latin1q\x07"
+        b"\x86q\x08Rq\tX\x06\x00\x00\x00_bytesq\nh\x05X\x14\x00\x00\x00\x0c|\x18"
+        b"\x00" + _PAYLOAD_ONE + b"q\x0bh\x07\x86q\x0cRq\ru\x86q\x0eb."
+    )
+
+    def test_round_trip(self, sample_ksuid):
+        """Every protocol round-trips to an equal, fully usable KSUID."""
+        str(sample_ksuid)  # populate the caches before pickling
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            restored = pickle.loads(pickle.dumps(sample_ksuid, protocol))
+            assert restored == sample_ksuid
+            assert str(restored) == str(sample_ksuid)
+            assert restored.to_base36() == sample_ksuid.to_base36()
+
+    def test_pickle_carries_only_raw_bytes(self, sample_ksuid):
+        """Cached encodings are not written into the pickle."""
+        str(sample_ksuid)
+        assert str(sample_ksuid).encode() not in pickle.dumps(sample_ksuid)
+
+    def test_loads_legacy_pickle(self):
+        """A KSUID pickled by 2.0.0 loads with its old slot state."""
+        restored = pickle.loads(self._LEGACY_PICKLE)
+        expected = KSUID(timestamp=_TS_2021, payload=_PAYLOAD_ONE)
+        assert restored == expected
+        assert restored.timestamp == _TS_2021
+        assert restored.payload == _PAYLOAD_ONE
+        assert str(restored) == str(expected)
+        assert restored.datetime == _EXPECTED_2021_UTC
+
+    def test_subclass_keeps_instance_dict(self):
+        """Pickling and copying a subclass keep its type and extra attributes."""
+        original = _KSUIDSubclass(timestamp=_TS_2021, payload=_PAYLOAD_ONE)
+        original.extra = 1
+        for restored in (
+            pickle.loads(pickle.dumps(original)),
+            copy.copy(original),
+            copy.deepcopy(original),
+        ):
+            assert type(restored) is _KSUIDSubclass
+            assert restored == original
+            assert restored.extra == 1
+
+    def test_legacy_state_keeps_subclass_dict(self):
+        """Both halves of 2.0.0's ``(dict, slots)`` state are applied."""
+        expected = KSUID(timestamp=_TS_2021, payload=_PAYLOAD_ONE)
+        restored = _KSUIDSubclass.__new__(_KSUIDSubclass)
+        restored.__setstate__(
+            (
+                {"extra": 1},
+                {
+                    "_timestamp": _TS_2021 - EPOCH,
+                    "_payload": _PAYLOAD_ONE,
+                    "_bytes": expected.bytes,
+                },
+            )
+        )
+        assert restored == expected
+        assert str(restored) == str(expected)
+        assert restored.extra == 1
+
+
 class TestThreadSafety:
     """Verify KSUID generation is safe under concurrent threads."""
 
@@ -360,6 +598,32 @@ class TestThreadSafety:
         assert len(all_tokens) == count_per_thread * num_threads
         assert len(set(all_tokens)) == len(all_tokens)
 
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_reuse_buffered_payloads(self):
+        """A forked child must not hand out the parent's buffered randomness."""
+        generate()  # ensure the parent has buffered payloads
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            # Never let the child fall back into the pytest session.
+            status = 1
+            try:
+                os.close(read_fd)
+                os.write(write_fd, generate().payload)
+                status = 0
+            finally:
+                os._exit(status)
+
+        os.close(write_fd)
+        child_payload = os.read(read_fd, 16)
+        os.close(read_fd)
+        _, wait_status = os.waitpid(pid, 0)
+
+        assert os.WIFEXITED(wait_status) and os.WEXITSTATUS(wait_status) == 0
+        assert len(child_payload) == 16
+        assert child_payload != generate().payload
+
 
 class TestLowercase:
     """Test base36 lowercase encoding/decoding."""
@@ -371,9 +635,8 @@ class TestLowercase:
 
     def test_generate_lowercase_charset(self):
         """Lowercase KSUID must contain only 0-9a-z."""
-        valid = set("0123456789abcdefghijklmnopqrstuvwxyz")
         s = generate_lowercase()
-        assert all(c in valid for c in s), f"invalid chars in {s!r}"
+        assert set(s) <= _VALID_BASE36, f"invalid chars in {s!r}"
 
     def test_generate_lowercase_has_no_uppercase(self):
         """Must not contain any uppercase letter."""
@@ -409,6 +672,14 @@ class TestLowercase:
             KSUID.from_base36("A" * 31)
         with pytest.raises(ValueError, match="Invalid base36 character"):
             KSUID.from_base36("!" * 31)
+        with pytest.raises(ValueError, match="Invalid base36 character: 'é'"):
+            KSUID.from_base36("é" * 31)
+
+    def test_from_base36_rejects_int_syntax(self):
+        """Signs, underscores and whitespace that int() accepts are invalid."""
+        for bad in ("+" + "0" * 30, "0_1" + "0" * 28, " " + "0" * 30, "0" * 30 + "\n"):
+            with pytest.raises(ValueError, match="Invalid base36 character"):
+                KSUID.from_base36(bad)
 
     def test_from_base36_overflow(self):
         """Max base36 31-char string must raise if it exceeds 20-byte max."""
@@ -435,9 +706,8 @@ class TestLowercase:
 
     def test_generate_token_lowercase_charset(self):
         """Lowercase token must contain only 0-9a-z."""
-        valid = set("0123456789abcdefghijklmnopqrstuvwxyz")
         token = generate_token_lowercase()
-        assert all(c in valid for c in token)
+        assert set(token) <= _VALID_BASE36
 
     def test_generate_token_lowercase_uniqueness(self):
         """100 lowercase tokens must all be distinct."""
@@ -471,6 +741,13 @@ class TestEdgeCases:
         assert s == "0" * 27
         assert KSUID.from_string(s) == ksuid
 
+    def test_reference_vector(self):
+        """Encoding must match the reference implementation's known vector."""
+        raw = bytes.fromhex("0669F7EFB5A1CD34B5F99D1154FB6853345C9735")
+        ksuid = KSUID.from_bytes(raw)
+        assert str(ksuid) == "0ujtsYcgvSTl8PAuAdqWYSMnLOv"
+        assert KSUID.from_string("0ujtsYcgvSTl8PAuAdqWYSMnLOv").bytes == raw
+
     def test_max_timestamp_round_trip(self):
         """KSUID at the maximum timestamp must round-trip correctly."""
         max_ts = EPOCH + 2**32 - 1
@@ -480,6 +757,67 @@ class TestEdgeCases:
         assert KSUID.from_string(s) == ksuid
 
 
+class TestPrefixedKSUID:
+    """Verify prefix splitting and parsing in the prefixed-ID examples."""
+
+    def test_parse_round_trip(self, sample_ksuid):
+        """parse() returns the prefix and the decoded KSUID."""
+        assert PrefixedKSUID.parse(f"user_{sample_ksuid}") == ("user", sample_ksuid)
+        # Only the first underscore is the delimiter
+        assert PrefixedKSUID.split_prefix("a_b_c") == "a"
+
+    @pytest.mark.parametrize(
+        "prefixed_id, message",
+        [
+            ("", "Invalid prefixed KSUID format"),
+            ("user2StGMtcWzRJ8qZqQjbJjGdTkVfv", "Invalid prefixed KSUID format"),
+            ("_2StGMtcWzRJ8qZqQjbJjGdTkVfv", "Prefix cannot be empty"),
+            ("user_garbage", "Invalid KSUID part"),
+        ],
+    )
+    def test_parse_rejects_invalid(self, prefixed_id, message):
+        """parse() raises the same errors as before for malformed IDs."""
+        with pytest.raises(ValueError, match=message):
+            PrefixedKSUID.parse(prefixed_id)
+        assert not PrefixedKSUID.validate(prefixed_id)
+
+    @pytest.mark.parametrize(
+        "prefixed_id, message",
+        [
+            ("user2StGMtcWzRJ8qZqQjbJjGdTkVfv", "Invalid prefixed KSUID format"),
+            ("_2StGMtcWzRJ8qZqQjbJjGdTkVfv", "Prefix cannot be empty"),
+        ],
+    )
+    def test_get_prefix_rejects_bad_prefix(self, prefixed_id, message):
+        """get_prefix() still rejects a missing delimiter or empty prefix."""
+        with pytest.raises(ValueError, match=message):
+            PrefixedKSUID.get_prefix(prefixed_id)
+
+    def test_get_prefix_does_not_validate_ksuid_part(self):
+        """get_prefix() only splits; the KSUID part is left to parse()."""
+        assert PrefixedKSUID.get_prefix("user_garbage") == "user"
+        with pytest.raises(ValueError, match="Invalid KSUID part"):
+            PrefixedKSUID.parse("user_garbage")
+
+    def test_create_many(self):
+        """create_many() returns unique prefixed IDs sharing one timestamp."""
+        ids = PrefixedKSUID.create_many("user", 50)
+        assert len(ids) == 50
+        assert len(set(ids)) == 50
+        assert all(i.startswith("user_") for i in ids)
+        ksuids = [PrefixedKSUID.get_ksuid(i) for i in ids]
+        assert len({k.timestamp for k in ksuids}) == 1
+        assert PrefixedKSUID.create_many("user", 0) == []
+
+    @pytest.mark.parametrize("prefix", ["", "1user", "user_x", "us-er"])
+    def test_create_many_rejects_invalid_prefix(self, prefix):
+        """create_many() raises the same ValueError as create()."""
+        with pytest.raises(ValueError) as expected:
+            PrefixedKSUID.create(prefix)
+        with pytest.raises(ValueError, match=str(expected.value)):
+            PrefixedKSUID.create_many(prefix, 3)
+
+
 if __name__ == "__main__":
     # Basic smoke test
     print("Running basic KSUID tests...")